@@ -0,0 +1,87 @@
+import pandas as pd
+import numpy as np
+from scipy.cluster.hierarchy import linkage, fcluster
+from scipy.spatial.distance import squareform
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_selection import mutual_info_classif
+from sklearn.inspection import permutation_importance
+
+def rank_features(X_train, y_train, mi_scores=None, feature_sets=None, validation_fraction=0.2, n_repeats=2, random_state=42):
+    """
+    Ranks features by mutual information and permutation importance using training data only.
+    Permutation importance is computed with a separate fit per entry of feature_sets, so correlated
+    features can be kept out of each other's model instead of masking each other's importance.
+    A small, shallow forest is used so ranking stays cheaper than the model fit it replaces.
+    """
+    if mi_scores is None:
+        mi_scores = mutual_info_classif(X_train, y_train, random_state=random_state)
+    if feature_sets is None:
+        feature_sets = [list(X_train.columns)]
+
+    # Permutation importance is measured on the most recent slice of the training window
+    split_index = int(len(X_train) * (1 - validation_fraction))
+    X_fit, X_val = X_train[:split_index], X_train[split_index:]
+    y_fit, y_val = y_train[:split_index], y_train[split_index:]
+
+    perm_scores = pd.Series(0.0, index=X_train.columns)
+    for columns in feature_sets:
+        model = RandomForestClassifier(n_estimators=30, max_depth=5, random_state=random_state, n_jobs=-1)
+        model.fit(X_fit[columns], y_fit)
+        perm = permutation_importance(model, X_val[columns], y_val, n_repeats=n_repeats, random_state=random_state)
+        perm_scores[columns] = perm.importances_mean
+
+    ranking = pd.DataFrame({
+        'mutual_information': np.asarray(mi_scores),
+        'permutation_importance': perm_scores.values
+    }, index=X_train.columns)
+
+    # Combine both measures by averaging their ranks so neither scale dominates
+    ranking['score'] = (ranking['mutual_information'].rank() + ranking['permutation_importance'].rank()) / 2
+    return ranking.sort_values('score', ascending=False)
+
+def cluster_correlated_features(X, correlation_threshold=0.9):
+    """
+    Groups features whose absolute correlation exceeds the threshold.
+    """
+    if X.shape[1] < 2:
+        return [list(X.columns)]
+
+    corr = X.corr().abs().fillna(0).to_numpy(copy=True)
+    np.fill_diagonal(corr, 1)
+    distance = squareform(1 - corr, checks=False)
+    labels = fcluster(linkage(distance, method='average'), t=1 - correlation_threshold, criterion='distance')
+
+    clusters = {}
+    for column, label in zip(X.columns, labels):
+        clusters.setdefault(label, []).append(column)
+    return list(clusters.values())
+
+def select_features(X_train, y_train, correlation_threshold=0.9, max_candidates=2, verbose=True):
+    """
+    Keeps the highest ranked feature from each cluster of correlated features.
+    """
+    clusters = cluster_correlated_features(X_train, correlation_threshold)
+
+    # Singletons are always kept; for correlated clusters, mutual information pre-filters
+    # the candidates so the costlier permutation ranking only sees a couple per cluster
+    selected = [cluster[0] for cluster in clusters if len(cluster) == 1]
+    contested = [cluster for cluster in clusters if len(cluster) > 1]
+    if contested:
+        columns = [col for cluster in contested for col in cluster]
+        mi_scores = pd.Series(mutual_info_classif(X_train[columns], y_train, random_state=42), index=columns)
+        cluster_candidates = [list(mi_scores[cluster].nlargest(max_candidates).index) for cluster in contested]
+        candidates = [col for group in cluster_candidates for col in group]
+
+        # Each permutation fit sees at most one candidate per cluster so its correlated partner cannot stand in for it
+        feature_sets = [[group[k] for group in cluster_candidates if len(group) > k] for k in range(max_candidates)]
+        ranking = rank_features(X_train[candidates], y_train, mi_scores=mi_scores[candidates], feature_sets=feature_sets)
+        for group in cluster_candidates:
+            selected.append(ranking.loc[group, 'score'].idxmax())
+
+    # Preserve the original column order
+    selected = [col for col in X_train.columns if col in selected]
+
+    if verbose:
+        print(f"Feature pruning kept {len(selected)} of {X_train.shape[1]} features.")
+
+    return selected
@@ -1,8 +1,8 @@
 from sp500_indicators import gather_all_data
 from preprocess import preprocess_data
 from feature_engineering import engineer_features
-from tuning import tune_hyperparameters
-from walk_forward_backtest import run_walk_forward_backtest
+from tuning import tune_hyperparameters, compare_tuning_pruning
+from walk_forward_backtest import run_walk_forward_backtest, compare_feature_pruning
 
 def main():
     """
@@ -11,7 +11,15 @@ def main():
     # --- Configuration ---
     config = {
         "data": {
-            "years": 10
+            "years": 10,
+            "min_put_call_rows": 252 * 4 # Put/Call history must cover a full training and testing window
+        },
+        "feature_pruning": {
+            "tuning": True, # Prune once before the grid search, where it cuts fit time
+            "backtest": False, # Per-fold pruning roughly breaks even on fit time, so it is opt-in
+            "correlation_threshold": 0.9,
+            "reselect_every": 3, # Refresh the selection once the training window has fully rolled over
+            "compare": False # Also run the unpruned arm and report time saved (doubles tuning and backtest cost)
         },
         "backtest": {
             "model_params": None, # Will be set by tuning
@@ -35,7 +43,7 @@ def main():
 
     # Step 2: Data Preprocessing
     print("\nPreprocessing data...")
-    preprocessed_df = preprocess_data(raw_df.copy())
+    preprocessed_df = preprocess_data(raw_df.copy(), min_put_call_rows=config["data"]["min_put_call_rows"])
     print("Data preprocessing complete.")
 
     # Step 3: Feature Engineering
@@ -45,13 +53,45 @@ def main():
 
     # Step 4: Hyperparameter Tuning
     print("\nRunning Hyperparameter Tuning...")
-    best_params = tune_hyperparameters(engineered_df, target_column=config["backtest"]["target_column"])
+    pruning = config["feature_pruning"]
+    target_column = config["backtest"]["target_column"]
+    if pruning["compare"]:
+        full_params, pruned_params = compare_tuning_pruning(
+            engineered_df,
+            target_column=target_column,
+            correlation_threshold=pruning["correlation_threshold"]
+        )
+        best_params = pruned_params if pruning["tuning"] else full_params
+    else:
+        best_params = tune_hyperparameters(
+            engineered_df,
+            target_column=target_column,
+            prune_features=pruning["tuning"],
+            correlation_threshold=pruning["correlation_threshold"]
+        )
     print("\nHyperparameter Tuning complete.")
 
     # Step 5: Walk-Forward Backtest with Tuned Model and Optimal Holding Period
     if best_params:
         config["backtest"]["model_params"] = best_params
-        run_walk_forward_backtest(engineered_df, **config["backtest"])
+        if pruning["compare"]:
+            backtest_config = {key: value for key, value in config["backtest"].items() if key != "model_params"}
+            compare_feature_pruning(
+                engineered_df,
+                full_params,
+                pruned_model_params=pruned_params,
+                correlation_threshold=pruning["correlation_threshold"],
+                reselect_every=pruning["reselect_every"],
+                **backtest_config
+            )
+        else:
+            run_walk_forward_backtest(
+                engineered_df,
+                prune_features=pruning["backtest"],
+                correlation_threshold=pruning["correlation_threshold"],
+                reselect_every=pruning["reselect_every"],
+                **config["backtest"]
+            )
         print("\nWalk-forward backtest with tuned model and optimal holding period complete.")
 
 
@@ -0,0 +1,170 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import yfinance as yf
+
+PUT_CALL_STORE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'put_call_history.csv')
+MARKET_TIMEZONE = 'America/New_York'
+
+# Longest gap, in calendar days, a snapshot is carried forward before the feature is treated as missing
+MAX_SNAPSHOT_AGE_DAYS = 4
+
+# Columns passed on to the model; the per-bucket totals stay in the store for analysis
+PUT_CALL_FEATURES = ['Put_Call_Ratio', 'Put_Call_Volume_Ratio']
+
+# Days-to-expiry buckets as (label, min_days, max_days)
+EXPIRY_BUCKETS = [
+    ('0_7d', 0, 7),
+    ('8_30d', 8, 30),
+    ('31_90d', 31, 90),
+    ('91d_plus', 91, None)
+]
+
+def fetch_option_chains(ticker, max_workers=8):
+    """
+    Fetches the option chain for every listed expiry concurrently with a bounded thread pool.
+    Returns the chains that were retrieved and the list of expiries that failed.
+    """
+    def fetch(expiry):
+        try:
+            chain = ticker.option_chain(expiry)
+            return expiry, chain.calls, chain.puts
+        except Exception as e:
+            print(f"Error fetching option chain for {expiry}: {e}")
+            return expiry, None, None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(fetch, ticker.options))
+
+    chains = {expiry: (calls, puts) for expiry, calls, puts in results if calls is not None}
+    failed = [expiry for expiry, calls, _ in results if calls is None]
+    return chains, failed
+
+def save_option_chains(chains, directory):
+    """
+    Records option chains to CSV files so they can be replayed without network access.
+    """
+    os.makedirs(directory, exist_ok=True)
+    for expiry, (calls, puts) in chains.items():
+        calls.to_csv(os.path.join(directory, f"{expiry}_calls.csv"), index=False)
+        puts.to_csv(os.path.join(directory, f"{expiry}_puts.csv"), index=False)
+
+def load_option_chains(directory):
+    """
+    Loads option chains previously recorded with save_option_chains.
+    """
+    chains = {}
+    for file_name in sorted(os.listdir(directory)):
+        if file_name.endswith('_calls.csv'):
+            expiry = file_name[:-len('_calls.csv')]
+            calls = pd.read_csv(os.path.join(directory, file_name))
+            puts = pd.read_csv(os.path.join(directory, f"{expiry}_puts.csv"))
+            chains[expiry] = (calls, puts)
+    return chains
+
+def get_session_date(as_of=None):
+    """
+    Returns the New York trading date a snapshot belongs to, rolling weekends back to Friday.
+    Naive timestamps are treated as New York local time.
+    """
+    as_of = pd.Timestamp.now(tz=MARKET_TIMEZONE) if as_of is None else pd.Timestamp(as_of)
+    if as_of.tzinfo is not None:
+        as_of = as_of.tz_convert(MARKET_TIMEZONE).tz_localize(None)
+    session_date = as_of.normalize()
+    if session_date.dayofweek >= 5:
+        session_date -= pd.offsets.BDay(1)
+    return session_date
+
+def get_expiry_bucket(expiry, as_of):
+    """
+    Returns the days-to-expiry bucket label for an expiry date.
+    """
+    days = (pd.Timestamp(expiry) - pd.Timestamp(as_of)).days
+    for label, min_days, max_days in EXPIRY_BUCKETS:
+        if days >= min_days and (max_days is None or days <= max_days):
+            return label
+    return None
+
+def aggregate_option_chains(chains, as_of):
+    """
+    Aggregates open interest and volume by expiry bucket into a single dated snapshot row.
+    """
+    as_of = pd.Timestamp(as_of).normalize()
+    totals = {label: {'Put_OI': 0, 'Call_OI': 0, 'Put_Volume': 0, 'Call_Volume': 0} for label, _, _ in EXPIRY_BUCKETS}
+
+    for expiry, (calls, puts) in chains.items():
+        bucket = get_expiry_bucket(expiry, as_of)
+        if bucket is None:
+            continue
+        totals[bucket]['Put_OI'] += puts['openInterest'].sum()
+        totals[bucket]['Call_OI'] += calls['openInterest'].sum()
+        totals[bucket]['Put_Volume'] += puts['volume'].sum()
+        totals[bucket]['Call_Volume'] += calls['volume'].sum()
+
+    row = {}
+    for label, values in totals.items():
+        for name, value in values.items():
+            row[f'{name}_{label}'] = value
+        row[f'Put_Call_Ratio_{label}'] = values['Put_OI'] / values['Call_OI'] if values['Call_OI'] else float('nan')
+
+    put_oi = sum(values['Put_OI'] for values in totals.values())
+    call_oi = sum(values['Call_OI'] for values in totals.values())
+    put_volume = sum(values['Put_Volume'] for values in totals.values())
+    call_volume = sum(values['Call_Volume'] for values in totals.values())
+    row['Put_Call_Ratio'] = put_oi / call_oi if call_oi else float('nan')
+    row['Put_Call_Volume_Ratio'] = put_volume / call_volume if call_volume else float('nan')
+
+    return pd.DataFrame([row], index=pd.DatetimeIndex([as_of], name='Date'))
+
+def load_put_call_history(store_path=PUT_CALL_STORE):
+    """
+    Loads the stored daily put/call snapshots as a DataFrame indexed by date.
+    """
+    if not os.path.exists(store_path):
+        return pd.DataFrame()
+    return pd.read_csv(store_path, index_col='Date', parse_dates=True)
+
+def align_to_trading_dates(history, trading_dates, max_age_days=MAX_SNAPSHOT_AGE_DAYS):
+    """
+    Carries each snapshot forward to trading dates at most max_age_days after it, so snapshots taken on
+    market holidays still reach the next session while gaps in collection stay missing.
+    """
+    return history.sort_index().reindex(trading_dates, method='ffill', tolerance=pd.Timedelta(days=max_age_days))
+
+def append_snapshot(snapshot, store_path=PUT_CALL_STORE):
+    """
+    Appends a dated snapshot to the local store, replacing any existing row for the same date.
+    """
+    history = load_put_call_history(store_path)
+    if not history.empty:
+        history = history[~history.index.isin(snapshot.index)]
+        snapshot = pd.concat([history, snapshot]).sort_index()
+
+    store_dir = os.path.dirname(store_path)
+    if store_dir:
+        os.makedirs(store_dir, exist_ok=True)
+    snapshot.to_csv(store_path, index_label='Date')
+    return snapshot
+
+def collect_put_call_snapshot(symbol="SPY", store_path=PUT_CALL_STORE, max_workers=8, as_of=None, ticker=None):
+    """
+    Fetches all option expiries for a ticker, aggregates them and appends the snapshot to the store
+    under the current New York trading date. Incomplete snapshots are not stored, so a failed expiry
+    can neither bias a bucket nor overwrite a complete row for the same date.
+    """
+    session_date = get_session_date(as_of)
+    try:
+        ticker = ticker or yf.Ticker(symbol)
+        chains, failed = fetch_option_chains(ticker, max_workers=max_workers)
+        if failed:
+            print(f"Skipping Put/Call snapshot for {symbol}: {len(failed)} of {len(failed) + len(chains)} expiries failed ({', '.join(failed)}).")
+            return pd.DataFrame()
+        if not chains:
+            print(f"No option chains were retrieved for {symbol}.")
+            return pd.DataFrame()
+        snapshot = aggregate_option_chains(chains, session_date)
+        append_snapshot(snapshot, store_path)
+        return snapshot
+    except Exception as e:
+        print(f"Error collecting Put/Call snapshot for {symbol}: {e}")
+        return pd.DataFrame()
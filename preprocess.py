@@ -1,4 +1,5 @@
 import pandas as pd
+from options_data import PUT_CALL_FEATURES
 
 def create_target_labels(df, periods):
     """
@@ -8,9 +9,11 @@ def create_target_labels(df, periods):
         df[f'Target_{period}d'] = (df['Close'].shift(-period) > df['Close']).astype(int)
     return df
 
-def preprocess_data(df):
+def preprocess_data(df, min_put_call_rows=252):
     """
     Performs preprocessing on the data.
+    Put/Call features are kept only when at least min_put_call_rows rows have them, in which case
+    rows before the first snapshot are dropped rather than back-filled.
     """
     # Select features
     features = [
@@ -19,15 +22,27 @@ def preprocess_data(df):
         'Bollinger_Upper', 'Bollinger_Lower', 'VIXCLS', 'DGS10',
         'value' # Fear & Greed Index value
     ]
-    df = df[features].copy()
+    put_call_features = [col for col in PUT_CALL_FEATURES if col in df.columns]
+    df = df[features + put_call_features].copy()
 
     print(f"Shape after feature selection: {df.shape}")
 
-    # Handle missing values
-    df.ffill(inplace=True)
-    df.bfill(inplace=True)
-    
     initial_rows = df.shape[0]
+
+    # Handle missing values
+    df[features] = df[features].ffill().bfill()
+
+    # Put/Call history only starts when collection began and is already aligned with a staleness limit,
+    # so it is neither forward- nor back-filled here; back-filling would leak later snapshots into earlier rows
+    if put_call_features:
+        has_put_call = df[put_call_features].notna().all(axis=1)
+        if has_put_call.sum() >= min_put_call_rows:
+            df = df[df.index >= has_put_call.idxmax()].copy()
+            print(f"Using Put/Call features from {df.index[0].date()} ({has_put_call.sum()} rows of history).")
+        else:
+            df = df.drop(columns=put_call_features)
+            print(f"Skipping Put/Call features: {has_put_call.sum()} rows of history, {min_put_call_rows} required.")
+
     df.dropna(inplace=True)
     final_rows = df.shape[0]
 
@@ -4,6 +4,7 @@ import requests
 import pandas_datareader.data as web
 import datetime
 import yfinance as yf
+from options_data import PUT_CALL_STORE, collect_put_call_snapshot, load_put_call_history, align_to_trading_dates
 
 # --- SENTIMENT INDICATORS ---
 
@@ -92,21 +93,6 @@ def calculate_obv(data):
     obv = (data['Volume'] * (~data['Close'].diff().le(0) * 2 - 1)).cumsum()
     return obv
 
-def get_put_call_ratio():
-    """
-    Calculates the Put/Call ratio for SPY.
-    """
-    try:
-        spy = yf.Ticker("SPY")
-        options = spy.option_chain(spy.options[0])
-        puts = options.puts
-        calls = options.calls
-        put_call_ratio = puts['openInterest'].sum() / calls['openInterest'].sum()
-        return put_call_ratio
-    except Exception as e:
-        print(f"Error fetching Put/Call Ratio: {e}")
-        return None
-
 # --- VALUATION INDICATORS ---
 
 def get_pe_ratio(ticker_symbol):
@@ -131,7 +117,7 @@ def get_dividend_yield(ticker_symbol):
         print(f"Error fetching dividend yield for {ticker_symbol}: {e}")
         return None
 
-def gather_all_data(years=10):
+def gather_all_data(years=10, put_call_store=PUT_CALL_STORE):
     """
     Gathers all the data into a single DataFrame.
     """
@@ -188,13 +174,20 @@ def gather_all_data(years=10):
         main_df = main_df.join(fng_df, rsuffix='_fng')
 
     # --- Add Valuation Indicators ---
-    main_df['Put_Call_Ratio'] = get_put_call_ratio()
     main_df['PE_Ratio'] = get_pe_ratio("SPY")
     main_df['Dividend_Yield'] = get_dividend_yield("SPY")
 
     # Forward-fill missing values
     main_df.ffill(inplace=True)
 
+    # --- Add Options Sentiment ---
+    # Record today's snapshot, then join the accumulated daily history after the forward-fill
+    # so gaps in collection stay missing instead of repeating a stale snapshot
+    collect_put_call_snapshot("SPY", store_path=put_call_store)
+    put_call_df = load_put_call_history(put_call_store)
+    if not put_call_df.empty:
+        main_df = main_df.join(align_to_trading_dates(put_call_df, main_df.index))
+
     return main_df
 
 
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The project modules live at the repository root rather than in a package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+from feature_selection import cluster_correlated_features, rank_features, select_features
+from walk_forward_backtest import run_walk_forward_backtest
+
+def make_features(rows=600, seed=0):
+    rng = np.random.default_rng(seed)
+    trend = np.cumsum(rng.normal(0, 1, rows))
+    signal = rng.normal(0, 1, rows)
+    X = pd.DataFrame({
+        'trend': trend,
+        'trend_lag_1': np.roll(trend, 1),
+        'trend_lag_2': np.roll(trend, 2),
+        'signal': signal,
+        'noise': rng.normal(0, 1, rows)
+    }, index=pd.bdate_range('2015-01-01', periods=rows))
+    y = pd.Series((signal + rng.normal(0, 0.5, rows) > 0).astype(int), index=X.index)
+    return X, y
+
+def test_cluster_correlated_features_groups_lags():
+    X, _ = make_features()
+    clusters = sorted(sorted(cluster) for cluster in cluster_correlated_features(X, correlation_threshold=0.9))
+    assert ['trend', 'trend_lag_1', 'trend_lag_2'] in clusters
+    assert ['signal'] in clusters
+    assert ['noise'] in clusters
+
+def test_select_features_keeps_one_feature_per_cluster():
+    X, y = make_features()
+    selected = select_features(X, y, correlation_threshold=0.9, verbose=False)
+    assert len(selected) == 3
+    assert 'signal' in selected and 'noise' in selected
+    assert len([col for col in selected if col.startswith('trend')]) == 1
+    assert selected == [col for col in X.columns if col in selected]
+
+def test_rank_features_separates_correlated_candidates():
+    X, y = make_features()
+    rng = np.random.default_rng(1)
+    X['signal_noisy'] = X['signal'] + rng.normal(0, 0.3, len(X))
+    candidates = X[['signal', 'signal_noisy', 'noise']]
+
+    ranking = rank_features(candidates, y, feature_sets=[['signal', 'noise'], ['signal_noisy', 'noise']])
+
+    # Fitted apart, neither correlated candidate can mask the other's importance
+    assert ranking.loc['signal', 'permutation_importance'] > 0.25
+    assert ranking.loc['signal_noisy', 'permutation_importance'] > 0.25
+    assert ranking.loc['signal', 'permutation_importance'] > ranking.loc['signal_noisy', 'permutation_importance']
+    assert ranking.loc['signal', 'score'] > ranking.loc['signal_noisy', 'score']
+    assert select_features(X, y, verbose=False).count('signal_noisy') == 0
+
+def test_walk_forward_backtest_rejects_invalid_reselect_every():
+    X, y = make_features()
+    df = X.assign(Close=100 + X['trend'].abs(), Target_21d=y)
+    for reselect_every in (0, -1):
+        with pytest.raises(ValueError):
+            run_walk_forward_backtest(df, {'n_estimators': 10}, prune_features=True, reselect_every=reselect_every)
+
+def test_walk_forward_backtest_prunes_and_reports_timing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    X, y = make_features(rows=252 * 5)
+    df = X.assign(Close=100 + X['trend'].abs(), Target_21d=y)
+    params = {'n_estimators': 10, 'max_depth': 3}
+
+    full = run_walk_forward_backtest(df, params, holding_period=5)
+    pruned = run_walk_forward_backtest(df, params, holding_period=5, prune_features=True, reselect_every=2)
+
+    assert pruned['avg_features'] < full['avg_features']
+    assert full['selection_time'] == 0
+    assert pruned['selection_time'] > 0
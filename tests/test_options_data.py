@@ -0,0 +1,125 @@
+import os
+from types import SimpleNamespace
+import numpy as np
+import pandas as pd
+import pytest
+import options_data
+from options_data import (
+    PUT_CALL_STORE, aggregate_option_chains, align_to_trading_dates, append_snapshot, collect_put_call_snapshot,
+    fetch_option_chains, get_expiry_bucket, get_session_date, load_option_chains, load_put_call_history
+)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'option_chains')
+AS_OF = pd.Timestamp('2024-03-15')
+
+class RecordedTicker:
+    """
+    Stands in for yf.Ticker by replaying the recorded option chains.
+    """
+    def __init__(self, directory, failing_expiries=()):
+        self.chains = load_option_chains(directory)
+        self.options = tuple(self.chains)
+        self.failing_expiries = set(failing_expiries)
+
+    def option_chain(self, expiry):
+        if expiry in self.failing_expiries:
+            raise ConnectionError(f"recorded failure for {expiry}")
+        calls, puts = self.chains[expiry]
+        return SimpleNamespace(calls=calls, puts=puts)
+
+def test_get_expiry_bucket_boundaries():
+    assert get_expiry_bucket('2024-03-14', AS_OF) is None
+    assert get_expiry_bucket('2024-03-15', AS_OF) == '0_7d'
+    assert get_expiry_bucket('2024-03-22', AS_OF) == '0_7d'
+    assert get_expiry_bucket('2024-03-23', AS_OF) == '8_30d'
+    assert get_expiry_bucket('2024-04-19', AS_OF) == '31_90d'
+    assert get_expiry_bucket('2024-12-20', AS_OF) == '91d_plus'
+
+def test_aggregate_recorded_chains():
+    snapshot = aggregate_option_chains(load_option_chains(FIXTURE_DIR), AS_OF)
+    row = snapshot.iloc[0]
+
+    assert list(snapshot.index) == [AS_OF]
+    # The expired 2024-03-14 chain is ignored and the day-0 expiry lands in the first bucket
+    assert row['Put_OI_0_7d'] == 650
+    assert row['Call_OI_0_7d'] == 600
+    assert row['Put_Call_Ratio_0_7d'] == pytest.approx(650 / 600)
+    assert np.isnan(row['Put_Call_Ratio_8_30d'])
+    assert row['Put_Call_Ratio_31_90d'] == pytest.approx(0.5)
+    assert row['Put_Call_Ratio_91d_plus'] == pytest.approx(2.0)
+    assert row['Put_Call_Ratio'] == pytest.approx(1740 / 1500)
+    assert row['Put_Call_Volume_Ratio'] == pytest.approx(117 / 110)
+
+def test_append_snapshot_replaces_same_date(tmp_path):
+    store_path = str(tmp_path / 'put_call_history.csv')
+    chains = load_option_chains(FIXTURE_DIR)
+    earlier = aggregate_option_chains(chains, '2024-03-14')
+    first = aggregate_option_chains(chains, AS_OF)
+    second = first.assign(Put_Call_Ratio=0.75)
+
+    append_snapshot(earlier, store_path)
+    append_snapshot(first, store_path)
+    append_snapshot(second, store_path)
+    history = load_put_call_history(store_path)
+
+    assert list(history.index) == [pd.Timestamp('2024-03-14'), AS_OF]
+    assert history.loc[AS_OF, 'Put_Call_Ratio'] == pytest.approx(0.75)
+
+def test_get_session_date_uses_new_york_calendar():
+    # Saturday and Sunday snapshots belong to Friday's session
+    assert get_session_date('2024-03-16 12:00') == AS_OF
+    assert get_session_date('2024-03-17 12:00') == AS_OF
+    # 01:00 UTC on Saturday is still Friday evening in New York
+    assert get_session_date(pd.Timestamp('2024-03-16 01:00', tz='UTC')) == AS_OF
+
+def test_align_to_trading_dates_keeps_holiday_snapshots():
+    history = pd.DataFrame({'Put_Call_Ratio': [1.1, 1.3]},
+                           index=pd.DatetimeIndex(['2024-03-28', '2024-03-29'], name='Date'))
+    # 2024-03-29 was Good Friday, so the next session is Monday 2024-04-01
+    trading_dates = pd.DatetimeIndex(['2024-03-27', '2024-03-28', '2024-04-01'])
+    aligned = align_to_trading_dates(history, trading_dates)
+
+    assert np.isnan(aligned.loc['2024-03-27', 'Put_Call_Ratio'])
+    assert aligned.loc['2024-03-28', 'Put_Call_Ratio'] == pytest.approx(1.1)
+    assert aligned.loc['2024-04-01', 'Put_Call_Ratio'] == pytest.approx(1.3)
+
+def test_align_to_trading_dates_leaves_collection_gaps_missing():
+    history = pd.DataFrame({'Put_Call_Ratio': [1.1]}, index=pd.DatetimeIndex(['2024-03-15'], name='Date'))
+    trading_dates = pd.DatetimeIndex(['2024-03-15', '2024-03-18', '2024-03-19', '2024-03-20', '2026-10-16'])
+    aligned = align_to_trading_dates(history, trading_dates, max_age_days=4)
+
+    assert aligned.loc['2024-03-18', 'Put_Call_Ratio'] == pytest.approx(1.1)
+    assert aligned.loc['2024-03-19', 'Put_Call_Ratio'] == pytest.approx(1.1)
+    assert aligned.loc[['2024-03-20', '2026-10-16'], 'Put_Call_Ratio'].isna().all()
+
+def test_collect_put_call_snapshot_from_recorded_chains(tmp_path):
+    store_path = str(tmp_path / 'put_call_history.csv')
+    snapshot = collect_put_call_snapshot(store_path=store_path, max_workers=2, as_of='2024-03-16 10:00',
+                                         ticker=RecordedTicker(FIXTURE_DIR))
+
+    assert list(snapshot.index) == [AS_OF]
+    assert snapshot.iloc[0]['Put_Call_Ratio'] == pytest.approx(1740 / 1500)
+    assert list(load_put_call_history(store_path).index) == [AS_OF]
+
+def test_fetch_option_chains_reports_failed_expiries():
+    chains, failed = fetch_option_chains(RecordedTicker(FIXTURE_DIR, failing_expiries=['2024-04-19']), max_workers=2)
+
+    assert failed == ['2024-04-19']
+    assert '2024-04-19' not in chains
+    assert len(chains) == 5
+
+def test_collect_put_call_snapshot_skips_incomplete_chains(tmp_path):
+    store_path = str(tmp_path / 'put_call_history.csv')
+    complete = collect_put_call_snapshot(store_path=store_path, as_of=AS_OF, ticker=RecordedTicker(FIXTURE_DIR))
+    partial = collect_put_call_snapshot(store_path=store_path, as_of=AS_OF,
+                                        ticker=RecordedTicker(FIXTURE_DIR, failing_expiries=['2024-04-19']))
+    history = load_put_call_history(store_path)
+
+    assert partial.empty
+    assert list(history.index) == [AS_OF]
+    assert history.loc[AS_OF, 'Put_Call_Ratio'] == pytest.approx(complete.iloc[0]['Put_Call_Ratio'])
+
+def test_put_call_store_is_anchored_to_module_directory():
+    module_dir = os.path.dirname(os.path.abspath(options_data.__file__))
+    assert os.path.isabs(PUT_CALL_STORE)
+    assert PUT_CALL_STORE == os.path.join(module_dir, 'data', 'put_call_history.csv')
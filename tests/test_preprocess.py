@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+from feature_engineering import engineer_features
+from options_data import align_to_trading_dates
+from preprocess import preprocess_data
+
+def make_raw_data(rows=400, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2023-01-02', periods=rows)
+    close = 4000 + np.cumsum(rng.normal(0, 20, rows))
+    df = pd.DataFrame({
+        'Open': close, 'High': close + 5, 'Low': close - 5, 'Close': close,
+        'Volume': rng.integers(1e9, 5e9, rows).astype(float),
+        'SMA_50': close, 'SMA_200': close, 'RSI': rng.uniform(20, 80, rows),
+        'MACD': rng.normal(0, 1, rows), 'MACD_Signal': rng.normal(0, 1, rows),
+        'Bollinger_Upper': close + 50, 'Bollinger_Lower': close - 50,
+        'VIXCLS': rng.uniform(12, 30, rows), 'DGS10': rng.uniform(3, 5, rows), 'value': rng.integers(0, 100, rows)
+    }, index=index)
+
+    # Snapshots only exist for the last 150 sessions, as if collection started part-way through
+    history = pd.DataFrame({
+        'Put_Call_Ratio': rng.uniform(0.8, 1.6, 150),
+        'Put_Call_Volume_Ratio': rng.uniform(0.8, 1.6, 150)
+    }, index=pd.DatetimeIndex(index[-150:], name='Date'))
+    return df.join(align_to_trading_dates(history, df.index)), history
+
+def test_put_call_history_survives_preprocessing_without_backfill():
+    raw_df, history = make_raw_data()
+    df = engineer_features(preprocess_data(raw_df, min_put_call_rows=100))
+
+    assert 'Put_Call_Ratio' in df.columns
+    assert df.index[0] >= history.index[0]
+    assert df['Put_Call_Ratio'].nunique() > 50
+    pd.testing.assert_series_equal(df['Put_Call_Ratio'], history['Put_Call_Ratio'].reindex(df.index), check_names=False)
+
+def test_short_put_call_history_is_dropped_not_backfilled():
+    raw_df, _ = make_raw_data()
+    df = preprocess_data(raw_df, min_put_call_rows=252)
+
+    assert 'Put_Call_Ratio' not in df.columns
+    assert df.index[0] == raw_df.index[0]
@@ -1,11 +1,15 @@
+import time
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import GridSearchCV, TimeSeriesSplit
 from sklearn.metrics import accuracy_score, classification_report
+from feature_selection import select_features
 
-def tune_hyperparameters(df, target_column='Target_21d'):
+def tune_hyperparameters(df, target_column='Target_21d', prune_features=False, correlation_threshold=0.9, return_timing=False):
     """
     Performs hyperparameter tuning for the RandomForestClassifier with a proper hold-out set.
+    When prune_features is set, redundant features are dropped using the training set only.
+    With return_timing, the grid search and feature selection times are returned alongside the parameters.
     """
     print("\n--- Hyperparameter Tuning with Hold-Out Set ---")
 
@@ -21,6 +25,14 @@ def tune_hyperparameters(df, target_column='Target_21d'):
     print(f"Training set size: {len(X_train)}")
     print(f"Hold-out set size: {len(X_holdout)}")
 
+    # Prune features once before the grid search so every grid point trains on the reduced set
+    selection_time = 0.0
+    if prune_features:
+        selection_start = time.perf_counter()
+        selected = select_features(X_train, y_train, correlation_threshold=correlation_threshold)
+        selection_time = time.perf_counter() - selection_start
+        X_train, X_holdout = X_train[selected], X_holdout[selected]
+
     # Define the parameter grid
     param_grid = {
         'n_estimators': [100, 200],
@@ -37,7 +49,10 @@ def tune_hyperparameters(df, target_column='Target_21d'):
     grid_search = GridSearchCV(estimator=model, param_grid=param_grid, cv=tscv, n_jobs=-1, verbose=2)
 
     # Fit the grid search on the training data
+    fit_start = time.perf_counter()
     grid_search.fit(X_train, y_train)
+    fit_time = time.perf_counter() - fit_start
+    print(f"\nGrid search fit time: {fit_time:.2f}s on {X_train.shape[1]} features")
 
     # Print the best parameters
     print("\nBest parameters found:")
@@ -52,4 +67,23 @@ def tune_hyperparameters(df, target_column='Target_21d'):
     print("\nClassification Report on the hold-out set:")
     print(classification_report(y_holdout, y_pred))
 
-    return grid_search.best_params_
\ No newline at end of file
+    if return_timing:
+        return grid_search.best_params_, {'fit_time': fit_time, 'selection_time': selection_time}
+    return grid_search.best_params_
+
+def compare_tuning_pruning(df, target_column='Target_21d', correlation_threshold=0.9):
+    """
+    Tunes the model with and without feature pruning and reports the grid search time saved.
+    Returns the best parameters for each arm so they can be backtested separately.
+    """
+    full_params, full_timing = tune_hyperparameters(df, target_column=target_column, return_timing=True)
+    pruned_params, pruned_timing = tune_hyperparameters(df, target_column=target_column, prune_features=True,
+                                                        correlation_threshold=correlation_threshold, return_timing=True)
+
+    pruned_total = pruned_timing['fit_time'] + pruned_timing['selection_time']
+    print("\n--- Tuning Feature Pruning Comparison ---")
+    print(f"Grid search fit time: {full_timing['fit_time']:.2f}s -> {pruned_timing['fit_time']:.2f}s")
+    print(f"Feature selection overhead: {pruned_timing['selection_time']:.2f}s")
+    print(f"Net time saved: {full_timing['fit_time'] - pruned_total:.2f}s")
+
+    return full_params, pruned_params
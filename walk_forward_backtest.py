@@ -1,15 +1,26 @@
+import time
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from sklearn.ensemble import RandomForestClassifier
+from feature_selection import select_features
 
-def run_walk_forward_backtest(df, model_params, holding_period=21, window_type='rolling', target_column='Target_21d', training_window=3, testing_window=1, step=1, transaction_cost=0.001, initial_capital=10000):
+def run_walk_forward_backtest(df, model_params, holding_period=21, window_type='rolling', target_column='Target_21d', training_window=3, testing_window=1, step=1, transaction_cost=0.001, initial_capital=10000, prune_features=False, correlation_threshold=0.9, reselect_every=1):
     """
     Performs a walk-forward backtest of the trading strategy with rolling or expanding windows.
+    When prune_features is set, redundant features are dropped using training data only. The selection
+    is recomputed every reselect_every folds and reused in between, so it never sees a fold's test data.
     """
+    if reselect_every < 1:
+        raise ValueError("reselect_every must be at least 1")
+
     years = sorted(df.index.year.unique())
     all_equity = [initial_capital]
     trade_log = []
+    fit_time = 0.0
+    selection_time = 0.0
+    feature_counts = []
+    selected = None
 
     print(f"\n--- Running {window_type.capitalize()} Window Backtest with Tuned Model ---")
 
@@ -39,9 +50,21 @@ def run_walk_forward_backtest(df, model_params, holding_period=21, window_type='
         y_train = train_df[target_column]
         X_test = test_df.drop(columns=[col for col in df.columns if 'Target' in col])
 
+        # Prune features on the training window only, reusing an earlier window's selection in between refreshes
+        if prune_features:
+            if selected is None or len(feature_counts) % reselect_every == 0:
+                selection_start = time.perf_counter()
+                selected = select_features(X_train, y_train, correlation_threshold=correlation_threshold)
+                selection_time += time.perf_counter() - selection_start
+            X_train = X_train[selected]
+            X_test = X_test[selected]
+        feature_counts.append(X_train.shape[1])
+
         # Train model
         model = RandomForestClassifier(**model_params, random_state=42)
+        fit_start = time.perf_counter()
         model.fit(X_train, y_train)
+        fit_time += time.perf_counter() - fit_start
         predictions = model.predict(X_test)
 
         # Simulate trades
@@ -64,6 +87,13 @@ def run_walk_forward_backtest(df, model_params, holding_period=21, window_type='
                 all_equity.append(all_equity[-1] * (1 + trade_return))
                 trade_log.append(f"{test_df.index[j].date()}: Exit trade at {exit_price:.2f}, Return: {trade_return:.2%}")
 
+    results = {
+        'fit_time': fit_time,
+        'selection_time': selection_time,
+        'avg_features': np.mean(feature_counts) if feature_counts else 0
+    }
+    print(f"\nModel fit time: {fit_time:.2f}s across {len(feature_counts)} folds")
+
     # Final performance metrics
     if len(all_equity) > 1:
         equity_series = pd.Series(all_equity)
@@ -84,16 +114,53 @@ def run_walk_forward_backtest(df, model_params, holding_period=21, window_type='
         print(f"Sharpe Ratio: {sharpe_ratio:.2f}")
         print(f"Maximum Drawdown: {max_drawdown:.2%}")
 
+        results.update({
+            'total_return': total_return,
+            'sharpe_ratio': sharpe_ratio,
+            'max_drawdown': max_drawdown
+        })
+
+        plot_suffix = '_pruned' if prune_features else ''
+
         # Plot equity curve
         plt.figure(figsize=(12, 8))
         equity_series.plot()
-        plt.title(f'Equity Curve - {window_type.capitalize()} Window - Tuned Model')
+        plt.title(f'Equity Curve - {window_type.capitalize()} Window - Tuned Model{" (Pruned Features)" if prune_features else ""}')
         plt.xlabel('Trade Number')
         plt.ylabel('Equity')
         plt.grid(True)
-        plt.savefig(f'equity_curve_{window_type}_tuned.png')
+        plt.savefig(f'equity_curve_{window_type}_tuned{plot_suffix}.png')
         plt.close()
-        print(f"\nEquity curve plot saved to equity_curve_{window_type}_tuned.png")
+        print(f"\nEquity curve plot saved to equity_curve_{window_type}_tuned{plot_suffix}.png")
 
     else:
-        print("\nNo trades were made during the backtest.")
\ No newline at end of file
+        print("\nNo trades were made during the backtest.")
+
+    return results
+
+def compare_feature_pruning(df, model_params, pruned_model_params=None, **backtest_kwargs):
+    """
+    Runs the walk-forward backtest with and without feature pruning and reports the difference.
+    Each arm uses its own tuned parameters when pruned_model_params is given.
+    """
+    backtest_kwargs.pop('prune_features', None)
+    correlation_threshold = backtest_kwargs.pop('correlation_threshold', 0.9)
+    reselect_every = backtest_kwargs.pop('reselect_every', 1)
+    full = run_walk_forward_backtest(df, model_params, prune_features=False, **backtest_kwargs)
+    pruned = run_walk_forward_backtest(df, pruned_model_params or model_params, prune_features=True,
+                                       correlation_threshold=correlation_threshold, reselect_every=reselect_every, **backtest_kwargs)
+
+    print("\n--- Feature Pruning Comparison ---")
+    if pruned_model_params is None:
+        print("Note: both runs use the same model parameters, so the comparison may favour the arm they were tuned on.")
+    pruned_total = pruned['fit_time'] + pruned['selection_time']
+    print(f"Average features per fold: {full['avg_features']:.1f} -> {pruned['avg_features']:.1f}")
+    print(f"Model fit time: {full['fit_time']:.2f}s -> {pruned['fit_time']:.2f}s")
+    print(f"Feature selection overhead: {pruned['selection_time']:.2f}s")
+    print(f"Net time saved: {full['fit_time'] - pruned_total:.2f}s ({full['fit_time']:.2f}s -> {pruned_total:.2f}s including selection)")
+    for metric in ['total_return', 'sharpe_ratio', 'max_drawdown']:
+        if metric in full and metric in pruned:
+            fmt = '.2f' if metric == 'sharpe_ratio' else '.2%'
+            print(f"{metric.replace('_', ' ').title()}: {full[metric]:{fmt}} -> {pruned[metric]:{fmt}} (change {pruned[metric] - full[metric]:+{fmt}})")
+
+    return full, pruned
\ No newline at end of file